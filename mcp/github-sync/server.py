@@ -0,0 +1,790 @@
+#!/usr/bin/env python3
+"""Oden GitHub Sync MCP server.
+
+Exposes the /oden:sync flow as MCP tools so epics and tasks can be pushed
+to GitHub Issues without shelling through the markdown command. Follows
+the same conventions as `.claude/commands/oden/sync.md`:
+
+- Task files live in `.claude/epics/` as `{epic}-task-{n}.md`
+- Issues are labeled `oden-epic` + the epic name
+- The CCPM template repository is protected from accidental writes
+
+Requires the `mcp` package (pip install mcp) and the `gh` CLI.
+"""
+
+import asyncio
+import json
+import logging
+import os
+import re
+import shutil
+import sys
+import time
+from urllib.parse import quote
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+
+import yaml
+
+try:
+    # C JSON parser; worthwhile for large 'gh issue list' payloads
+    import orjson as _json
+except ImportError:
+    import json as _json
+
+try:
+    # libyaml-backed loader/dumper: parses in C, several times faster
+    from yaml import CSafeLoader as _YamlLoader, CSafeDumper as _YamlDumper
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader, SafeDumper as _YamlDumper
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+try:
+    from mcp.server import Server
+    from mcp.server.stdio import stdio_server
+    import mcp.types as types
+except ImportError:
+    Server = None
+
+log = logging.getLogger("oden.github_sync")
+
+# Label colors matching .claude/commands/oden/sync.md conventions
+_LABEL_COLORS = {"oden-epic": "0E8A16", "feature": "A2EEEF"}
+_DEFAULT_LABEL_COLOR = "1D76DB"
+
+# Matches both SSH (git@github.com:owner/repo.git) and HTTPS
+# (https://github.com/owner/repo) remote URLs; group 1 is owner/repo.
+_REMOTE_RE = re.compile(
+    r"^(?:git@github\.com:|https?://github\.com/)"
+    r"([^/\s]+/[^/\s]+?)(?:\.git)?/?$")
+
+
+class OdenGitHubSync:
+    """Syncs Oden epics and tasks to GitHub Issues via the gh CLI."""
+
+    def __init__(self, project_root: str):
+        self.project_root = project_root
+        self.tasks_dir = os.path.join(project_root, ".claude", "epics")
+        self.github_token = os.environ.get("GITHUB_TOKEN", "")
+        self._session: Optional["aiohttp.ClientSession"] = None
+        self._repo_info_cache: Optional[Dict[str, Any]] = None
+        self._auth_cache: Optional[float] = None  # last successful check
+        # Global cap on concurrent child processes: each gh/git fork
+        # costs tens of MB resident, so an unbounded gather could thrash
+        self._proc_sem = asyncio.Semaphore(
+            int(os.environ.get("ODEN_MAX_PROCS", "8")))
+        # Resolve the CLIs once; a missing binary fails fast instead of
+        # raising FileNotFoundError on every tool call
+        self._tool_paths = {"gh": shutil.which("gh"),
+                            "git": shutil.which("git")}
+        self._ensured_labels: set = set()
+
+    def _get_session(self) -> "aiohttp.ClientSession":
+        """Lazily create the shared HTTP session (keep-alive across calls)."""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                headers={
+                    "Authorization": f"Bearer {self.github_token}",
+                    "Accept": "application/vnd.github+json",
+                    "X-GitHub-Api-Version": "2022-11-28",
+                },
+                connector=aiohttp.TCPConnector(limit_per_host=64),
+            )
+        return self._session
+
+    async def aclose(self) -> None:
+        """Release the HTTP session on server shutdown."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+
+    async def run_command(self, cmd: List[str], cwd: Optional[str] = None,
+                          timeout: float = 30,
+                          input_data: Optional[bytes] = None) -> Dict[str, Any]:
+        """Run a command without blocking the event loop.
+
+        Uses asyncio subprocesses so the server keeps servicing other tool
+        calls while gh/git round-trips are in flight. `input_data` is fed
+        to the child's stdin when given.
+        """
+        if cmd[0] in self._tool_paths:
+            resolved = self._tool_paths[cmd[0]]
+            if resolved is None:
+                return {"success": False, "stdout": "",
+                        "stderr": f"❌ {cmd[0]} not installed: "
+                                  f"Install {cmd[0]} and restart the server",
+                        "returncode": 127}
+            # Full path skips the PATH walk in the child's exec
+            cmd = [resolved, *cmd[1:]]
+
+        async with self._proc_sem:
+            try:
+                proc = await asyncio.create_subprocess_exec(
+                    *cmd,
+                    stdin=asyncio.subprocess.PIPE if input_data is not None else None,
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.PIPE,
+                    cwd=cwd or self.project_root,
+                )
+            except FileNotFoundError as e:
+                return {"success": False, "stdout": "", "stderr": str(e),
+                        "returncode": 127}
+
+            try:
+                stdout, stderr = await asyncio.wait_for(
+                    proc.communicate(input_data), timeout=timeout)
+            except asyncio.TimeoutError:
+                proc.kill()
+                await proc.wait()
+                return {"success": False, "stdout": "",
+                        "stderr": f"Command timed out after {timeout}s: "
+                                  f"{cmd[0]}",
+                        "returncode": -1}
+
+            return {
+                "success": proc.returncode == 0,
+                "stdout": stdout.decode("utf-8", errors="replace"),
+                "stderr": stderr.decode("utf-8", errors="replace"),
+                "returncode": proc.returncode,
+            }
+
+    async def _auth_ok(self) -> bool:
+        """Check gh auth, cached for 60s.
+
+        Auth state rarely changes mid-session, and 'gh auth status' costs
+        ~100ms per call; the TTL keeps back-to-back syncs from re-paying it.
+        Only success is cached, so running 'gh auth login' after a failed
+        check takes effect immediately instead of after the TTL expires.
+        """
+        now = time.monotonic()
+        if self._auth_cache is not None and now - self._auth_cache < 60:
+            return True
+        result = await self.run_command(["gh", "auth", "status"])
+        if result["success"]:
+            self._auth_cache = now
+        return result["success"]
+
+    def get_current_iso_datetime(self) -> str:
+        """Real UTC datetime per /rules/datetime.md (never placeholders)."""
+        return (datetime.now(timezone.utc)
+                .isoformat(timespec="seconds")
+                .replace("+00:00", "Z"))
+
+    def _git_config_mtime(self) -> Optional[float]:
+        try:
+            return os.stat(os.path.join(self.project_root,
+                                        ".git", "config")).st_mtime
+        except OSError:
+            return None
+
+    def _load_remote_cache(self, mtime: float) -> Optional[str]:
+        """Return the cached remote URL if .git/config hasn't changed."""
+        try:
+            with open(os.path.join(self.project_root, ".oden",
+                                   "remote.json"), encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("git_config_mtime") == mtime:
+                return data.get("url")
+        except (OSError, ValueError):
+            pass
+        return None
+
+    def _save_remote_cache(self, mtime: float, url: str) -> None:
+        cache_dir = os.path.join(self.project_root, ".oden")
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+            with open(os.path.join(cache_dir, "remote.json"), "w",
+                      encoding="utf-8") as f:
+                json.dump({"git_config_mtime": mtime, "url": url}, f)
+        except OSError:
+            pass  # cache is best-effort only
+
+    async def get_repository_info(self) -> Dict[str, Any]:
+        """Resolve owner/repo from the origin remote.
+
+        The remote never changes within a server process, so the parsed
+        result is cached to avoid spawning git on every tool call. A
+        warm cache in .oden/remote.json, keyed by the .git/config mtime,
+        also lets fresh server starts skip the git fork entirely.
+        Failures are not cached; a fixed remote is picked up on retry.
+        """
+        if self._repo_info_cache is not None:
+            return self._repo_info_cache
+
+        mtime = self._git_config_mtime()
+        remote_url = self._load_remote_cache(mtime) if mtime else None
+        if remote_url is None:
+            result = await self.run_command(
+                ["git", "remote", "get-url", "origin"])
+            if not result["success"]:
+                return {"success": False,
+                        "error": "No git remote. "
+                                 "Run: git remote add origin <url>"}
+            remote_url = result["stdout"].strip()
+            if mtime is not None:
+                self._save_remote_cache(mtime, remote_url)
+        lowered = remote_url.lower()
+        if "automazeio/ccpm" in lowered:
+            return {"success": False,
+                    "error": "Cannot sync to the CCPM template repository. "
+                             "Update remote: git remote set-url origin <your repo>"}
+        if "template" in lowered or "example" in lowered:
+            return {"success": False,
+                    "error": f"Remote looks like a template repo: {remote_url}"}
+
+        match = _REMOTE_RE.match(remote_url)
+        if match is None:
+            return {"success": False,
+                    "error": f"Remote is not a GitHub URL: {remote_url}"}
+
+        self._repo_info_cache = {"success": True, "repo": match.group(1),
+                                 "remote_url": remote_url}
+        return self._repo_info_cache
+
+    async def read_task_file(self, filepath: str) -> Optional[Dict[str, Any]]:
+        """Parse a task markdown file into frontmatter + body."""
+        return await asyncio.to_thread(self._read_task_file_sync, filepath)
+
+    def _read_task_file_sync(self, filepath: str) -> Optional[Dict[str, Any]]:
+        try:
+            with open(filepath, "r", encoding="utf-8") as f:
+                content = f.read()
+            parts = content.split("---", 2)
+            if len(parts) < 3:
+                return None
+            frontmatter = yaml.load(parts[1], Loader=_YamlLoader) or {}
+            return {
+                "filepath": filepath,
+                "frontmatter": frontmatter,
+                "body": parts[2].lstrip("\n"),
+                "name": frontmatter.get("name", os.path.basename(filepath)),
+                "epic": frontmatter.get("epic", ""),
+                "labels": frontmatter.get("labels", []),
+                "work_stream": frontmatter.get("work_stream"),
+            }
+        except Exception:
+            log.exception("Error reading task file %s", filepath)
+            return None
+
+    async def find_epic_tasks(self, epic_name: str) -> List[Dict[str, Any]]:
+        """Collect all task files belonging to an epic."""
+        if not os.path.isdir(self.tasks_dir):
+            return []
+        prefix = f"{epic_name}-task-"
+        with os.scandir(self.tasks_dir) as it:
+            paths = [
+                entry.path for entry in it
+                if entry.name.startswith(prefix)
+                and entry.name.endswith(".md")
+                and entry.is_file()
+            ]
+        # Read + YAML-parse off the event loop, all files at once
+        results = await asyncio.gather(
+            *[asyncio.to_thread(self._read_task_file_sync, fp)
+              for fp in paths])
+        tasks = [t for t in results if t is not None]
+
+        def _order(task: Dict[str, Any]):
+            # Numeric sort on the task suffix so task-10 follows task-9
+            # in the tracking-issue checklist
+            stem = os.path.basename(task["filepath"])[len(prefix):-3]
+            return (0, int(stem)) if stem.isdigit() else (1, stem)
+
+        tasks.sort(key=_order)
+        return tasks
+
+    async def create_github_issue(self, title: str, body: str,
+                                  labels: List[str],
+                                  repo: str) -> Dict[str, Any]:
+        """Create one GitHub issue and return its number and URL.
+
+        Uses the REST API over a shared keep-alive session when aiohttp
+        and a token are available; one TLS handshake serves the whole
+        epic instead of one gh fork+exec per issue. Falls back to the
+        gh CLI so the server still works without extra dependencies.
+        """
+        if aiohttp is not None and self.github_token:
+            return await self._create_issue_api(title, body, labels, repo)
+        return await self._create_issue_gh(title, body, labels, repo)
+
+    async def _create_issue_api(self, title: str, body: str,
+                                labels: List[str],
+                                repo: str) -> Dict[str, Any]:
+        session = self._get_session()
+        url = f"https://api.github.com/repos/{repo}/issues"
+        payload = {"title": title, "body": body, "labels": labels}
+        last_error = ""
+        for attempt in range(4):
+            if attempt:
+                await asyncio.sleep(2 ** attempt)
+            try:
+                async with session.post(url, json=payload) as resp:
+                    if resp.status == 201:
+                        data = await resp.json()
+                        return {"success": True, "number": data["number"],
+                                "url": data["html_url"], "title": title}
+                    last_error = f"HTTP {resp.status}: {await resp.text()}"
+                    # Retry on rate limiting and server errors only
+                    if resp.status not in (403, 429) and resp.status < 500:
+                        break
+            except aiohttp.ClientError as e:
+                last_error = str(e)
+        return {"success": False, "error": last_error}
+
+    async def _ensure_labels_gh(self, repo: str, labels: List[str]) -> None:
+        """Create labels gh doesn't know yet; gh won't auto-create them.
+
+        Mirrors the sync command's 'gh label create ... || true': an
+        already-exists failure is ignored. Each name is only attempted
+        once per process.
+        """
+        for label in labels:
+            if label in self._ensured_labels:
+                continue
+            await self.run_command(
+                ["gh", "label", "create", label, "--repo", repo, "--color",
+                 _LABEL_COLORS.get(label, _DEFAULT_LABEL_COLOR)])
+            self._ensured_labels.add(label)
+
+    async def _create_issue_gh(self, title: str, body: str,
+                               labels: List[str],
+                               repo: str) -> Dict[str, Any]:
+        # Unlike the REST endpoint, gh fails outright on unknown labels
+        if labels:
+            await self._ensure_labels_gh(repo, labels)
+        # Feed the body via stdin (--body-file -) so no temp file touches
+        # disk on the per-issue hot path.
+        cmd = ["gh", "issue", "create", "--repo", repo,
+               "--title", title, "--body-file", "-"]
+        if labels:
+            if any("," in label for label in labels):
+                # Frontmatter labels are user-edited and may contain
+                # commas, which would split inside a joined flag
+                for label in labels:
+                    cmd += ["--label", label]
+            else:
+                # gh accepts comma-separated labels in one flag
+                cmd += ["--label", ",".join(labels)]
+        result = await self.run_command(cmd, input_data=body.encode("utf-8"))
+
+        if not result["success"]:
+            return {"success": False, "error": result["stderr"].strip()}
+
+        url = result["stdout"].strip().splitlines()[-1]
+        try:
+            number = int(url.rstrip("/").rsplit("/", 1)[-1])
+        except ValueError:
+            return {"success": False,
+                    "error": f"Could not parse issue URL: {url}"}
+        return {"success": True, "number": number, "url": url, "title": title}
+
+    @staticmethod
+    def _gq(value: str) -> str:
+        """Escape a value as a GraphQL string literal (JSON rules apply)."""
+        return json.dumps(value)
+
+    async def _graphql(self, document: str) -> Optional[Dict[str, Any]]:
+        """POST a GraphQL document; returns the data map or None on failure.
+
+        Goes through the shared aiohttp session when available, otherwise
+        through 'gh api graphql' with the document fed via stdin.
+        """
+        if aiohttp is not None and self.github_token:
+            session = self._get_session()
+            try:
+                async with session.post("https://api.github.com/graphql",
+                                        json={"query": document}) as resp:
+                    if resp.status != 200:
+                        return None
+                    payload = await resp.json()
+            except aiohttp.ClientError:
+                return None
+        else:
+            # -F expands @- to stdin; -f would pass the literal "@-"
+            result = await self.run_command(
+                ["gh", "api", "graphql", "-F", "query=@-"],
+                input_data=document.encode("utf-8"), timeout=60)
+            try:
+                # gh exits non-zero on GraphQL errors but still prints
+                # the full response, which may carry partial data
+                payload = json.loads(result["stdout"])
+            except ValueError:
+                return None
+        data = payload.get("data")
+        if payload.get("errors"):
+            # Root mutations run serially, so aliases before the failing
+            # one have already created real issues and are reported in
+            # `data`. Returning None here would make the caller re-run
+            # the whole epic and duplicate them; surface the partial
+            # data instead and let callers record missing aliases as
+            # per-spec failures.
+            log.warning("GraphQL reported errors: %s", payload["errors"])
+            return data or None
+        return data
+
+    async def _create_label(self, repo: str, name: str) -> Optional[str]:
+        """Create a repo label (or fetch it if it exists); return its node ID."""
+        color = _LABEL_COLORS.get(name, _DEFAULT_LABEL_COLOR)
+        labels_url = f"repos/{repo}/labels"
+        if aiohttp is not None and self.github_token:
+            session = self._get_session()
+            try:
+                async with session.post(
+                        f"https://api.github.com/{labels_url}",
+                        json={"name": name, "color": color}) as resp:
+                    if resp.status == 201:
+                        return (await resp.json()).get("node_id")
+                    already_exists = resp.status == 422
+                if already_exists:
+                    async with session.get(
+                            f"https://api.github.com/{labels_url}/"
+                            f"{quote(name)}") as resp:
+                        if resp.status == 200:
+                            return (await resp.json()).get("node_id")
+            except aiohttp.ClientError:
+                pass
+            return None
+
+        result = await self.run_command(
+            ["gh", "api", labels_url,
+             "-f", f"name={name}", "-f", f"color={color}"])
+        if not result["success"]:
+            # Probably already exists; fetch it instead
+            result = await self.run_command(
+                ["gh", "api", f"{labels_url}/{quote(name)}"])
+            if not result["success"]:
+                return None
+        try:
+            return json.loads(result["stdout"]).get("node_id")
+        except ValueError:
+            return None
+
+    async def _create_issues_batch(self, specs: List[tuple],
+                                   repo: str) -> Optional[List[Dict[str, Any]]]:
+        """Create many issues in a single GraphQL request.
+
+        `specs` is a list of (title, body, labels). createIssue mutations
+        are aliased t0..tN inside one document, so the whole epic costs
+        one HTTPS round trip instead of N. Returns per-spec result dicts
+        aligned with `specs`, or None when the batch path is unavailable
+        (callers then fall back to per-issue creation).
+        """
+        owner, _, name = repo.partition("/")
+        data = await self._graphql(
+            f"query {{ repository(owner: {self._gq(owner)}, "
+            f"name: {self._gq(name)}) "
+            "{ id labels(first: 100) { nodes { id name } } } }")
+        if not data or not data.get("repository"):
+            return None
+        repo_id = data["repository"]["id"]
+        label_ids = {node["name"]: node["id"]
+                     for node in data["repository"]["labels"]["nodes"]}
+
+        # createIssue only accepts label node IDs, and on a fresh repo
+        # oden-epic and the epic label don't exist yet, so create any
+        # missing labels first (matching the gh/REST paths, which create
+        # labels by name). A label beyond the first 100 fetched above
+        # comes back as already-exists and is fetched by name. If one
+        # still can't be resolved, decline the batch and let the
+        # per-issue fallback handle the epic.
+        needed = {l: None for _, _, labels in specs for l in labels}
+        for label in needed:
+            if label not in label_ids:
+                node_id = await self._create_label(repo, label)
+                if node_id is None:
+                    return None
+                label_ids[label] = node_id
+
+        mutations = []
+        for i, (title, body, labels) in enumerate(specs):
+            ids = ", ".join(self._gq(label_ids[l]) for l in labels)
+            mutations.append(
+                f"t{i}: createIssue(input: {{"
+                f"repositoryId: {self._gq(repo_id)}, "
+                f"title: {self._gq(title)}, body: {self._gq(body)}, "
+                f"labelIds: [{ids}]}}) {{ issue {{ number url }} }}")
+        data = await self._graphql("mutation {\n" + "\n".join(mutations)
+                                   + "\n}")
+        if data is None:
+            return None
+
+        results = []
+        for i, (title, _, _) in enumerate(specs):
+            issue = (data.get(f"t{i}") or {}).get("issue")
+            if issue:
+                results.append({"success": True, "number": issue["number"],
+                                "url": issue["url"], "title": title})
+            else:
+                results.append({"success": False,
+                                "error": "createIssue returned no issue"})
+        return results
+
+    async def update_task_with_issue(self, task: Dict[str, Any],
+                                     issue_result: Dict[str, Any]) -> bool:
+        """Write the created issue back into the task frontmatter."""
+        return await asyncio.to_thread(self._update_task_with_issue_sync,
+                                       task, issue_result)
+
+    def _update_task_with_issue_sync(self, task: Dict[str, Any],
+                                     issue_result: Dict[str, Any]) -> bool:
+        try:
+            frontmatter = task["frontmatter"]
+            frontmatter["github"] = issue_result["url"]
+            frontmatter["github_issue"] = issue_result["number"]
+            ts = self.get_current_iso_datetime()
+            frontmatter["synced_at"] = ts
+            frontmatter["updated"] = ts
+            content = (
+                "---\n"
+                + yaml.dump(frontmatter, Dumper=_YamlDumper,
+                            default_flow_style=False,
+                            allow_unicode=True, sort_keys=False)
+                + "---\n\n"
+                + task["body"]
+            )
+            with open(task["filepath"], "w", encoding="utf-8") as f:
+                f.write(content)
+            return True
+        except Exception:
+            log.exception("Error updating task file %s", task["filepath"])
+            return False
+
+    async def create_epic_tracking_issue(self, epic_name: str,
+                                         tasks: List[Dict[str, Any]],
+                                         repo: str) -> Dict[str, Any]:
+        """Create the epic issue with a checklist of all task issues."""
+        try:
+            prefix = f"[{epic_name}] "
+            tasks_md = "\n".join(
+                f"- [ ] #{t['number']}: {t['title'].removeprefix(prefix)}"
+                for t in tasks)
+            body = (
+                f"# Epic: {epic_name}\n\n"
+                f"Tracking issue for the `{epic_name}` epic.\n\n"
+                "## Tasks\n\n"
+                f"{tasks_md}\n\n"
+                "---\n"
+                f"Synced: {self.get_current_iso_datetime()}\n"
+                "Managed by Oden Forge - do not edit the task list by hand.\n"
+            )
+            return await self.create_github_issue(
+                f"Epic: {epic_name}", body,
+                ["oden-epic", f"epic:{epic_name}", "feature"], repo)
+        except Exception as e:
+            log.exception("Error creating epic tracking issue for %s",
+                          epic_name)
+            return {"success": False, "error": str(e)}
+
+    async def sync_epic_to_github(self, epic_name: str) -> Dict[str, Any]:
+        """Full sync: create one issue per task plus the epic tracking issue."""
+        if self._tool_paths.get("gh") is None:
+            return {"success": False,
+                    "error": "❌ gh not installed: Install the GitHub CLI "
+                             "and restart the server"}
+        if not await self._auth_ok():
+            return {"success": False,
+                    "error": "GitHub CLI not authenticated. Run: gh auth login"}
+
+        repo_info = await self.get_repository_info()
+        if not repo_info["success"]:
+            return repo_info
+        repo = repo_info["repo"]
+
+        tasks = await self.find_epic_tasks(epic_name)
+        if not tasks:
+            return {"success": False,
+                    "error": f"No tasks found for epic '{epic_name}'. "
+                             f"Run: /oden:tasks {epic_name}"}
+
+        specs = []
+        for task in tasks:
+            # Order-preserving dedup: the epic name or work stream can
+            # repeat labels already present in the task frontmatter
+            labels = list({
+                label: None
+                for label in ("oden-epic", task["epic"],
+                              *task.get("labels", []),
+                              task.get("work_stream"))
+                if label
+            })
+            specs.append((f"[{epic_name}] {task['name']}", task["body"],
+                          labels))
+
+        # One aliased-createIssue GraphQL request covers the whole epic;
+        # single-task epics and batch failures use the per-issue path.
+        results = None
+        if len(specs) > 1:
+            results = await self._create_issues_batch(specs, repo)
+            if results is None:
+                log.warning("Batch issue creation unavailable for epic %s; "
+                            "falling back to per-issue creation", epic_name)
+
+        if results is None:
+            # Fan the per-issue calls out concurrently; the semaphore
+            # keeps us under GitHub's secondary rate limits.
+            sem = asyncio.Semaphore(8)
+
+            async def _one(spec: tuple) -> Dict[str, Any]:
+                async with sem:
+                    title, body, labels = spec
+                    return await self.create_github_issue(title, body,
+                                                          labels, repo)
+
+            results = await asyncio.gather(*[_one(s) for s in specs],
+                                           return_exceptions=True)
+
+        created = []
+        failed = []
+        for task, result in zip(tasks, results):
+            if isinstance(result, BaseException):
+                failed.append({"task": task["name"], "error": str(result)})
+            elif result["success"]:
+                created.append((task, result))
+            else:
+                failed.append({"task": task["name"],
+                               "error": result.get("error")})
+
+        # Write all frontmatter updates at once, off the event loop
+        if created:
+            await asyncio.gather(
+                *[self.update_task_with_issue(task, result)
+                  for task, result in created])
+        created_issues = [result for _, result in created]
+
+        tracking = None
+        if created_issues:
+            tracking = await self.create_epic_tracking_issue(
+                epic_name, created_issues, repo)
+
+        return {
+            "success": not failed,
+            "repo": repo,
+            "epic": epic_name,
+            "created": len(created_issues),
+            "failed": failed,
+            "issues": created_issues,
+            "tracking_issue": tracking,
+        }
+
+    async def create_single_issue(self, title: str, body: str,
+                                  labels: List[str]) -> Dict[str, Any]:
+        """Create a standalone issue in the project repository."""
+        repo_info = await self.get_repository_info()
+        if not repo_info["success"]:
+            return repo_info
+        return await self.create_github_issue(title, body, labels,
+                                              repo_info["repo"])
+
+    async def count_oden_issues(self) -> Dict[str, Any]:
+        """Count open issues created by Oden (label: oden-epic)."""
+        result = await self.run_command(
+            ["gh", "issue", "list", "--label", "oden-epic",
+             "--state", "all", "--limit", "1000",
+             "--json", "number,state"])
+        if not result["success"]:
+            return {"success": False, "error": result["stderr"].strip()}
+        issues = _json.loads(result["stdout"] or "[]")
+        open_count = sum(1 for i in issues if i.get("state") == "OPEN")
+        return {"success": True, "total": len(issues), "open": open_count,
+                "closed": len(issues) - open_count}
+
+    async def check_github_status(self) -> Dict[str, Any]:
+        """Report auth, repository, and synced-issue status."""
+        if self._tool_paths.get("gh") is None:
+            return {"success": False, "authenticated": False,
+                    "error": "❌ gh not installed: Install the GitHub CLI "
+                             "and restart the server"}
+        if not await self._auth_ok():
+            return {"success": False, "authenticated": False,
+                    "error": "GitHub CLI not authenticated. Run: gh auth login"}
+
+        repo_info = await self.get_repository_info()
+        if not repo_info["success"]:
+            return {"success": False, "authenticated": True,
+                    "error": repo_info["error"]}
+
+        counts = await self.count_oden_issues()
+        return {"success": True, "authenticated": True,
+                "repo": repo_info["repo"], "issues": counts}
+
+
+async def serve() -> None:
+    sync = OdenGitHubSync(os.environ.get("ODEN_PROJECT_ROOT", os.getcwd()))
+    server = Server("oden-github-sync")
+
+    @server.list_tools()
+    async def list_tools() -> List["types.Tool"]:
+        return [
+            types.Tool(
+                name="sync_epic",
+                description="Sync an Oden epic and its tasks to GitHub Issues",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "epic_name": {"type": "string"},
+                    },
+                    "required": ["epic_name"],
+                },
+            ),
+            types.Tool(
+                name="create_issue",
+                description="Create a single GitHub issue in the project repo",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "title": {"type": "string"},
+                        "body": {"type": "string"},
+                        "labels": {"type": "array",
+                                   "items": {"type": "string"}},
+                    },
+                    "required": ["title", "body"],
+                },
+            ),
+            types.Tool(
+                name="github_status",
+                description="Check GitHub auth, repository, and sync status",
+                inputSchema={"type": "object", "properties": {}},
+            ),
+        ]
+
+    @server.call_tool()
+    async def call_tool(name: str,
+                        arguments: Dict[str, Any]) -> List["types.TextContent"]:
+        if name == "sync_epic":
+            result = await sync.sync_epic_to_github(arguments["epic_name"])
+        elif name == "create_issue":
+            result = await sync.create_single_issue(
+                arguments["title"], arguments["body"],
+                arguments.get("labels", []))
+        elif name == "github_status":
+            result = await sync.check_github_status()
+        else:
+            result = {"success": False, "error": f"Unknown tool: {name}"}
+        return [types.TextContent(type="text",
+                                  text=json.dumps(result, indent=2))]
+
+    try:
+        async with stdio_server() as (read_stream, write_stream):
+            await server.run(read_stream, write_stream,
+                             server.create_initialization_options())
+    finally:
+        await sync.aclose()
+
+
+def main() -> None:
+    # stdout carries the MCP protocol; logging must stay on stderr
+    logging.basicConfig(
+        level=logging.INFO, stream=sys.stderr,
+        format="%(asctime)s %(name)s %(levelname)s %(message)s")
+    if Server is None:
+        print("❌ mcp package not installed: Run: pip install mcp",
+              file=sys.stderr)
+        sys.exit(1)
+    asyncio.run(serve())
+
+
+if __name__ == "__main__":
+    main()